@@ -18,6 +18,7 @@ import (
 
 type SpecStore interface {
 	GetSpec() (*models.BuilderSpec, error)
+	GetInstance(name string) (*models.BuilderInstance, error)
 	Update(func(*models.BuilderSpec) error) (*models.BuilderSpec, error)
 }
 
@@ -2,6 +2,8 @@ package api
 
 import (
 	"context"
+	"crypto/sha256"
+	"crypto/subtle"
 	"net/http"
 
 	"github.com/danielgtaylor/huma/v2"
@@ -20,7 +22,7 @@ func registerAuth(api huma.API, deps *Dependencies) {
 	}) (*struct {
 		Body TokenResponse
 	}, error) {
-		if input.Body.Token != deps.Config.AdminSecretToken {
+		if !tokenMatches(input.Body.Token, deps.Config.AdminSecretToken) {
 			deps.Logger.Warn("login failed: invalid admin token")
 			return nil, huma.Error401Unauthorized("invalid token")
 		}
@@ -63,3 +65,11 @@ func registerAuthCheck(api huma.API, deps *Dependencies) {
 		return nil, nil
 	})
 }
+
+// tokenMatches compares two secrets in constant time. Both are hashed first so
+// the comparison does not reveal the length of the expected token either.
+func tokenMatches(given, expected string) bool {
+	givenSum := sha256.Sum256([]byte(given))
+	expectedSum := sha256.Sum256([]byte(expected))
+	return subtle.ConstantTimeCompare(givenSum[:], expectedSum[:]) == 1
+}
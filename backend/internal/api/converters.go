@@ -59,8 +59,12 @@ func normalizeInstance(cfg *config.Config, instance *models.BuilderInstance) err
 	if instance.MinecraftVersion == "" {
 		return NewValidationError("minecraft_version", "minecraft_version is required")
 	}
-	if instance.LoaderName == "" {
+	if name := strings.TrimSpace(string(instance.LoaderName)); name == "" {
 		instance.LoaderName = models.LoaderVanilla
+	} else if loader, ok := models.ParseLoaderType(name); ok {
+		instance.LoaderName = loader
+	} else {
+		return NewValidationError("loader_name", "loader_name must be one of: "+models.LoaderNames)
 	}
 	if instance.LoaderName != models.LoaderVanilla && strings.TrimSpace(instance.LoaderVersion) == "" {
 		return NewValidationError("loader_version", "loader_version is required")
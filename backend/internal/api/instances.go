@@ -88,7 +88,7 @@ func registerInstances(api huma.API, deps *Dependencies) {
 			return nil, mapAppError(err)
 		}
 
-		_, created := findInstance(updated, instance.Name)
+		created := findInstance(updated, instance.Name)
 		if created == nil {
 			return nil, huma.Error500InternalServerError("failed to create instance")
 		}
@@ -123,11 +123,10 @@ func registerInstances(api huma.API, deps *Dependencies) {
 		if err := deps.ensureAuth(input.Authorization); err != nil {
 			return nil, err
 		}
-		spec, err := deps.Store.GetSpec()
+		instance, err := deps.Store.GetInstance(input.Name)
 		if err != nil {
 			return nil, huma.Error500InternalServerError(err.Error())
 		}
-		_, instance := findInstance(spec, input.Name)
 		if instance == nil {
 			return nil, huma.Error404NotFound("instance not found")
 		}
@@ -185,7 +184,7 @@ func registerInstances(api huma.API, deps *Dependencies) {
 			return nil, mapAppError(err)
 		}
 
-		_, current := findInstance(updated, newInstance.Name)
+		current := findInstance(updated, newInstance.Name)
 		deps.Logger.Info("instance updated", "name", input.Name, "new_name", newInstance.Name)
 		return &struct{ Body APIInstance }{Body: toAPIInstance(*current)}, nil
 	})
@@ -304,13 +303,12 @@ func instanceIndex(spec *models.BuilderSpec, name string) int {
 	return -1
 }
 
-func findInstance(spec *models.BuilderSpec, name string) (int, *models.BuilderInstance) {
-	for i := range spec.Instances {
-		if spec.Instances[i].Name == name {
-			return i, &spec.Instances[i]
-		}
+func findInstance(spec *models.BuilderSpec, name string) *models.BuilderInstance {
+	idx := instanceIndex(spec, name)
+	if idx == -1 {
+		return nil
 	}
-	return -1, nil
+	return &spec.Instances[idx]
 }
 
 func mapAppError(err error) error {
@@ -11,6 +11,8 @@ import (
 	"time"
 
 	"github.com/danielgtaylor/huma/v2"
+
+	store "github.com/Petr1Furious/potato-launcher/backend/internal/storage"
 )
 
 func getLauncherFilename(osName, artifact, launcherName string) (string, error) {
@@ -189,12 +191,12 @@ func registerLaunchers(api huma.API, deps *Dependencies) {
 
 		path := filepath.Join(dir, filename)
 		mode := launcherFileMode(input.OS, input.Artifact)
-		if err := os.WriteFile(path, input.RawBody, mode); err != nil {
+		if err := store.WriteFileAtomic(path, input.RawBody, mode); err != nil {
 			deps.Logger.Error("failed to write launcher file", "path", path, "error", err)
 			return nil, huma.Error500InternalServerError("failed to write file")
 		}
 
-		_ = os.WriteFile(filepath.Join(dir, "version.txt"), []byte(version+"\n"), 0o644)
+		_ = store.WriteFileAtomic(filepath.Join(dir, "version.txt"), []byte(version+"\n"), 0o644)
 
 		deps.Logger.Info(
 			"launcher uploaded",
@@ -1,6 +1,9 @@
 package models
 
-import "time"
+import (
+	"strings"
+	"time"
+)
 
 type LoaderType string
 
@@ -11,6 +14,22 @@ const (
 	LoaderNeo     LoaderType = "neoforge"
 )
 
+// LoaderNames lists the supported loaders, for use in error messages.
+const LoaderNames = "vanilla, forge, fabric, neoforge"
+
+var loadersByName = map[string]LoaderType{
+	string(LoaderVanilla): LoaderVanilla,
+	string(LoaderForge):   LoaderForge,
+	string(LoaderFabric):  LoaderFabric,
+	string(LoaderNeo):     LoaderNeo,
+}
+
+// ParseLoaderType looks up a loader by its case-insensitive name.
+func ParseLoaderType(name string) (LoaderType, bool) {
+	loader, ok := loadersByName[strings.ToLower(name)]
+	return loader, ok
+}
+
 type AuthType string
 
 const (
@@ -1,7 +1,9 @@
 package services
 
 import (
+	"crypto/sha256"
 	"errors"
+	"sync"
 	"time"
 
 	"github.com/golang-jwt/jwt/v5"
@@ -9,27 +11,48 @@ import (
 	"github.com/Petr1Furious/potato-launcher/backend/internal/config"
 )
 
+// maxVerifiedTokens bounds the validated-token cache. Any token beyond it is
+// simply validated in full each time.
+const maxVerifiedTokens = 1024
+
 type AuthService struct {
-	cfg *config.Config
+	cfg      *config.Config
+	secret   []byte
+	tokenTTL time.Duration
+	parser   *jwt.Parser
+
+	// verified remembers tokens that passed validation, until they expire.
+	// Tokens are keyed by their SHA-256 digest, so the raw tokens are not kept.
+	mu       sync.Mutex
+	verified map[[sha256.Size]byte]*jwt.RegisteredClaims
 }
 
 func NewAuthService(cfg *config.Config) *AuthService {
-	return &AuthService{cfg: cfg}
+	return &AuthService{
+		cfg:      cfg,
+		secret:   []byte(cfg.AdminJWTSecret),
+		tokenTTL: time.Duration(cfg.AccessTokenExpireMinutes) * time.Minute,
+		// Only HS256 tokens are ever issued, so reject any other algorithm.
+		parser:   jwt.NewParser(jwt.WithValidMethods([]string{jwt.SigningMethodHS256.Alg()})),
+		verified: make(map[[sha256.Size]byte]*jwt.RegisteredClaims),
+	}
 }
 
 func (a *AuthService) CreateAccessToken(subject string) (string, error) {
 	claims := jwt.RegisteredClaims{
 		Subject:   subject,
-		ExpiresAt: jwt.NewNumericDate(time.Now().Add(time.Duration(a.cfg.AccessTokenExpireMinutes) * time.Minute)),
+		ExpiresAt: jwt.NewNumericDate(time.Now().Add(a.tokenTTL)),
 	}
 	token := jwt.NewWithClaims(jwt.SigningMethodHS256, claims)
-	return token.SignedString([]byte(a.cfg.AdminJWTSecret))
+	return token.SignedString(a.secret)
 }
 
 func (a *AuthService) ValidateToken(raw string) (*jwt.RegisteredClaims, error) {
-	token, err := jwt.ParseWithClaims(raw, &jwt.RegisteredClaims{}, func(token *jwt.Token) (interface{}, error) {
-		return []byte(a.cfg.AdminJWTSecret), nil
-	})
+	digest := sha256.Sum256([]byte(raw))
+	if claims := a.cachedClaims(digest); claims != nil {
+		return claims, nil
+	}
+	token, err := a.parser.ParseWithClaims(raw, &jwt.RegisteredClaims{}, a.key)
 	if err != nil {
 		return nil, err
 	}
@@ -40,5 +63,45 @@ func (a *AuthService) ValidateToken(raw string) (*jwt.RegisteredClaims, error) {
 	if claims.Subject != "single_user" {
 		return nil, errors.New("invalid JWT subject")
 	}
+	a.rememberClaims(digest, claims)
 	return claims, nil
 }
+
+func (a *AuthService) key(*jwt.Token) (interface{}, error) {
+	return a.secret, nil
+}
+
+func (a *AuthService) cachedClaims(digest [sha256.Size]byte) *jwt.RegisteredClaims {
+	a.mu.Lock()
+	defer a.mu.Unlock()
+	claims, ok := a.verified[digest]
+	if !ok {
+		return nil
+	}
+	if !time.Now().Before(claims.ExpiresAt.Time) {
+		delete(a.verified, digest)
+		return nil
+	}
+	return claims
+}
+
+// rememberClaims caches a validated token. Tokens without an expiry are not
+// cached, so they keep being checked in full.
+func (a *AuthService) rememberClaims(digest [sha256.Size]byte, claims *jwt.RegisteredClaims) {
+	if claims.ExpiresAt == nil {
+		return
+	}
+	now := time.Now()
+
+	a.mu.Lock()
+	defer a.mu.Unlock()
+	for key, cached := range a.verified {
+		if !now.Before(cached.ExpiresAt.Time) {
+			delete(a.verified, key)
+		}
+	}
+	if len(a.verified) >= maxVerifiedTokens {
+		return
+	}
+	a.verified[digest] = claims
+}
@@ -0,0 +1,100 @@
+package services
+
+import (
+	"bytes"
+	"io"
+	"net/http"
+	"sync"
+)
+
+// revalidatingTransport remembers the last successful GET response for each
+// URL that carried an ETag or Last-Modified validator. Later requests for the
+// same URL are sent as conditional GETs, and a 304 reply is answered with the
+// remembered body, so unchanged upstream metadata is not downloaded again.
+type revalidatingTransport struct {
+	base    http.RoundTripper
+	mu      sync.Mutex
+	entries map[string]*revalidationEntry
+}
+
+type revalidationEntry struct {
+	etag         string
+	lastModified string
+	header       http.Header
+	body         []byte
+}
+
+func newRevalidatingTransport(base http.RoundTripper) *revalidatingTransport {
+	return &revalidatingTransport{base: base, entries: make(map[string]*revalidationEntry)}
+}
+
+func (t *revalidatingTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	if req.Method != http.MethodGet {
+		return t.base.RoundTrip(req)
+	}
+	key := req.URL.String()
+
+	t.mu.Lock()
+	entry := t.entries[key]
+	t.mu.Unlock()
+
+	if entry != nil {
+		req = req.Clone(req.Context())
+		if entry.etag != "" {
+			req.Header.Set("If-None-Match", entry.etag)
+		}
+		if entry.lastModified != "" {
+			req.Header.Set("If-Modified-Since", entry.lastModified)
+		}
+	}
+
+	resp, err := t.base.RoundTrip(req)
+	if err != nil {
+		return nil, err
+	}
+	if resp.StatusCode == http.StatusNotModified && entry != nil {
+		resp.Body.Close()
+		return entry.response(req), nil
+	}
+	if resp.StatusCode != http.StatusOK {
+		return resp, nil
+	}
+
+	etag := resp.Header.Get("ETag")
+	lastModified := resp.Header.Get("Last-Modified")
+	if etag == "" && lastModified == "" {
+		return resp, nil
+	}
+	body, err := io.ReadAll(resp.Body)
+	resp.Body.Close()
+	if err != nil {
+		return nil, err
+	}
+
+	t.mu.Lock()
+	t.entries[key] = &revalidationEntry{
+		etag:         etag,
+		lastModified: lastModified,
+		header:       resp.Header.Clone(),
+		body:         body,
+	}
+	t.mu.Unlock()
+
+	resp.Body = io.NopCloser(bytes.NewReader(body))
+	resp.ContentLength = int64(len(body))
+	return resp, nil
+}
+
+func (e *revalidationEntry) response(req *http.Request) *http.Response {
+	return &http.Response{
+		Status:        "200 OK",
+		StatusCode:    http.StatusOK,
+		Proto:         "HTTP/1.1",
+		ProtoMajor:    1,
+		ProtoMinor:    1,
+		Header:        e.header.Clone(),
+		Body:          io.NopCloser(bytes.NewReader(e.body)),
+		ContentLength: int64(len(e.body)),
+		Request:       req,
+	}
+}
@@ -6,10 +6,10 @@ import (
 	"encoding/xml"
 	"errors"
 	"fmt"
-	"io"
 	"net/http"
 	"slices"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/Petr1Furious/potato-launcher/backend/internal/models"
@@ -22,11 +22,115 @@ const (
 	neoforgeMetadataURL = "https://maven.neoforged.net/releases/net/neoforged/neoforge/maven-metadata.xml"
 )
 
+// metadataTTL is how long upstream version metadata is reused before it is
+// fetched again.
+const metadataTTL = 10 * time.Minute
+
 var httpClient = &http.Client{
-	Timeout: 10 * time.Second,
+	Timeout:   10 * time.Second,
+	Transport: newRevalidatingTransport(http.DefaultTransport),
+}
+
+var (
+	mojangManifestCache   = newTTLCache[*vanillaManifest](metadataTTL)
+	fabricLoaderCache     = newTTLCache[[]string](metadataTTL)
+	forgeMetadataCache    = newTTLCache[map[string][]string](metadataTTL)
+	neoforgeVersionsCache = newTTLCache[*neoforgeVersions](metadataTTL)
+)
+
+// ttlCache memoizes values per key for a fixed duration. Concurrent lookups
+// of a missing or expired key wait for a single fetch instead of each
+// hitting the upstream. Failed fetches are not cached.
+type ttlCache[T any] struct {
+	ttl     time.Duration
+	mu      sync.Mutex
+	entries map[string]*ttlEntry[T]
+}
+
+type ttlEntry[T any] struct {
+	mu      sync.Mutex
+	value   T
+	expires time.Time
+}
+
+func newTTLCache[T any](ttl time.Duration) *ttlCache[T] {
+	return &ttlCache[T]{ttl: ttl, entries: make(map[string]*ttlEntry[T])}
+}
+
+func (c *ttlCache[T]) get(key string, fetch func() (T, error)) (T, error) {
+	c.mu.Lock()
+	entry, ok := c.entries[key]
+	if !ok {
+		entry = &ttlEntry[T]{}
+		c.entries[key] = entry
+	}
+	c.mu.Unlock()
+
+	entry.mu.Lock()
+	defer entry.mu.Unlock()
+	if time.Now().Before(entry.expires) {
+		return entry.value, nil
+	}
+	value, err := fetch()
+	if err != nil {
+		var zero T
+		return zero, err
+	}
+	entry.value = value
+	entry.expires = time.Now().Add(c.ttl)
+	return value, nil
+}
+
+type vanillaVersion struct {
+	ID   string `json:"id"`
+	Type string `json:"type"`
+}
+
+// vanillaManifest holds the Mojang version list in its published order, plus
+// the set of version ids for membership checks.
+type vanillaManifest struct {
+	versions []vanillaVersion
+	ids      map[string]struct{}
+}
+
+func getVanillaManifest(ctx context.Context) (*vanillaManifest, error) {
+	return mojangManifestCache.get("", func() (*vanillaManifest, error) {
+		versions, err := fetchMojangManifest(ctx)
+		if err != nil {
+			return nil, err
+		}
+		ids := make(map[string]struct{}, len(versions))
+		for _, v := range versions {
+			ids[v.ID] = struct{}{}
+		}
+		return &vanillaManifest{versions: versions, ids: ids}, nil
+	})
+}
+
+func vanillaHasVersion(ctx context.Context, version string) (bool, error) {
+	manifest, err := getVanillaManifest(ctx)
+	if err != nil {
+		return false, err
+	}
+	_, ok := manifest.ids[version]
+	return ok, nil
 }
 
 func GetVanillaVersions(ctx context.Context, versionType string) ([]string, error) {
+	manifest, err := getVanillaManifest(ctx)
+	if err != nil {
+		return nil, err
+	}
+	out := make([]string, 0, len(manifest.versions))
+	for _, v := range manifest.versions {
+		if versionType == "" || strings.EqualFold(v.Type, versionType) {
+			out = append(out, v.ID)
+		}
+	}
+	return out, nil
+}
+
+func fetchMojangManifest(ctx context.Context) ([]vanillaVersion, error) {
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, mojangManifestURL, nil)
 	if err != nil {
 		return nil, err
@@ -40,44 +144,60 @@ func GetVanillaVersions(ctx context.Context, versionType string) ([]string, erro
 		return nil, fmt.Errorf("mojang manifest error: %s", resp.Status)
 	}
 	var payload struct {
-		Versions []struct {
-			ID   string `json:"id"`
-			Type string `json:"type"`
-		} `json:"versions"`
+		Versions []vanillaVersion `json:"versions"`
 	}
 	if err := json.NewDecoder(resp.Body).Decode(&payload); err != nil {
 		return nil, err
 	}
-	out := make([]string, 0, len(payload.Versions))
-	for _, v := range payload.Versions {
-		if versionType == "" || strings.EqualFold(v.Type, versionType) {
-			out = append(out, v.ID)
-		}
-	}
-	return out, nil
+	return payload.Versions, nil
 }
 
 func GetLoadersForVersion(ctx context.Context, version string) ([]models.LoaderType, error) {
-	vanilla, err := GetVanillaVersions(ctx, "")
-	if err != nil {
-		return nil, err
+	// Each lookup may hit a different upstream, so run them concurrently.
+	var (
+		wg         sync.WaitGroup
+		isVanilla  bool
+		vanillaErr error
+		found      [len(loaderProbes)]bool
+	)
+	wg.Add(1 + len(loaderProbes))
+	go func() {
+		defer wg.Done()
+		isVanilla, vanillaErr = vanillaHasVersion(ctx, version)
+	}()
+	for i, probe := range loaderProbes {
+		go func(i int, has func(context.Context, string) (bool, error)) {
+			defer wg.Done()
+			found[i], _ = has(ctx, version)
+		}(i, probe.has)
+	}
+	wg.Wait()
+
+	if vanillaErr != nil {
+		return nil, vanillaErr
 	}
-	loaders := make([]models.LoaderType, 0, 4)
-	if slices.Contains(vanilla, version) {
+	loaders := make([]models.LoaderType, 0, 1+len(loaderProbes))
+	if isVanilla {
 		loaders = append(loaders, models.LoaderVanilla)
 	}
-	if ok, _ := fabricHasLoader(ctx, version); ok {
-		loaders = append(loaders, models.LoaderFabric)
-	}
-	if ok, _ := forgeHasLoader(ctx, version); ok {
-		loaders = append(loaders, models.LoaderForge)
-	}
-	if ok, _ := neoforgeHasLoader(ctx, version); ok {
-		loaders = append(loaders, models.LoaderNeo)
+	for i, probe := range loaderProbes {
+		if found[i] {
+			loaders = append(loaders, probe.loader)
+		}
 	}
 	return loaders, nil
 }
 
+// loaderProbes lists the mod loaders in the order GetLoadersForVersion reports them.
+var loaderProbes = [...]struct {
+	loader models.LoaderType
+	has    func(context.Context, string) (bool, error)
+}{
+	{models.LoaderFabric, fabricHasLoader},
+	{models.LoaderForge, forgeHasLoader},
+	{models.LoaderNeo, neoforgeHasLoader},
+}
+
 func GetLoaderVersions(ctx context.Context, version string, loader models.LoaderType) ([]string, error) {
 	switch loader {
 	case models.LoaderVanilla:
@@ -99,6 +219,12 @@ func fabricHasLoader(ctx context.Context, version string) (bool, error) {
 }
 
 func getFabricLoaderVersions(ctx context.Context, version string) ([]string, error) {
+	return fabricLoaderCache.get(version, func() ([]string, error) {
+		return fetchFabricLoaderVersions(ctx, version)
+	})
+}
+
+func fetchFabricLoaderVersions(ctx context.Context, version string) ([]string, error) {
 	url := fabricMetaBaseURL + version
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
 	if err != nil {
@@ -138,7 +264,7 @@ func getFabricLoaderVersions(ctx context.Context, version string) ([]string, err
 }
 
 func forgeHasLoader(ctx context.Context, version string) (bool, error) {
-	data, err := fetchForgeMetadata(ctx)
+	data, err := getForgeMetadata(ctx)
 	if err != nil {
 		return false, err
 	}
@@ -147,29 +273,65 @@ func forgeHasLoader(ctx context.Context, version string) (bool, error) {
 }
 
 func getForgeLoaderVersions(ctx context.Context, version string) ([]string, error) {
-	data, err := fetchForgeMetadata(ctx)
+	data, err := getForgeMetadata(ctx)
 	if err != nil {
 		return nil, err
 	}
 	items := data[version]
-	out := make([]string, 0, len(items))
+	keyed := make([]keyedVersion, 0, len(items))
 	prefix := version + "-"
 	for _, item := range items {
-		if strings.HasPrefix(item, prefix) {
-			out = append(out, strings.TrimPrefix(item, prefix))
-		} else {
-			out = append(out, item)
-		}
+		loader := strings.TrimPrefix(item, prefix)
+		keyed = append(keyed, keyedVersion{version: loader, key: versionKey(loader)})
 	}
-	slices.SortFunc(out, func(a, b string) int {
-		if a == b {
-			return 0
+	slices.SortFunc(keyed, func(a, b keyedVersion) int {
+		if c := slices.Compare(b.key, a.key); c != 0 {
+			return c
 		}
-		return strings.Compare(b, a)
+		return strings.Compare(b.version, a.version)
 	})
+	out := make([]string, len(keyed))
+	for i := range keyed {
+		out[i] = keyed[i].version
+	}
 	return out, nil
 }
 
+// keyedVersion pairs a version string with its precomputed sort key.
+type keyedVersion struct {
+	version string
+	key     []int
+}
+
+// versionKey returns the numeric components of a version string, so that
+// "47.10.0" sorts after "47.9.0". Non-digit characters only separate numbers.
+func versionKey(version string) []int {
+	key := make([]int, 0, 4)
+	n, inNumber := 0, false
+	for i := 0; i < len(version); i++ {
+		c := version[i]
+		if c >= '0' && c <= '9' {
+			n = n*10 + int(c-'0')
+			inNumber = true
+			continue
+		}
+		if inNumber {
+			key = append(key, n)
+			n, inNumber = 0, false
+		}
+	}
+	if inNumber {
+		key = append(key, n)
+	}
+	return key
+}
+
+func getForgeMetadata(ctx context.Context) (map[string][]string, error) {
+	return forgeMetadataCache.get("", func() (map[string][]string, error) {
+		return fetchForgeMetadata(ctx)
+	})
+}
+
 func fetchForgeMetadata(ctx context.Context) (map[string][]string, error) {
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, forgeMetadataURL, nil)
 	if err != nil {
@@ -191,8 +353,16 @@ func fetchForgeMetadata(ctx context.Context) (map[string][]string, error) {
 }
 
 func neoforgeHasLoader(ctx context.Context, version string) (bool, error) {
-	versions, err := getNeoforgeLoaderVersions(ctx, version)
-	return len(versions) > 0, err
+	prefix := mcToNeoforgePrefix(version)
+	if prefix == "" {
+		return false, nil
+	}
+	versions, err := getNeoforgeVersions(ctx)
+	if err != nil {
+		return false, err
+	}
+	i, _ := slices.BinarySearch(versions.sorted, prefix)
+	return i < len(versions.sorted) && strings.HasPrefix(versions.sorted[i], prefix), nil
 }
 
 func getNeoforgeLoaderVersions(ctx context.Context, version string) ([]string, error) {
@@ -200,12 +370,12 @@ func getNeoforgeLoaderVersions(ctx context.Context, version string) ([]string, e
 	if prefix == "" {
 		return nil, nil
 	}
-	items, err := fetchNeoforgeVersions(ctx)
+	versions, err := getNeoforgeVersions(ctx)
 	if err != nil {
 		return nil, err
 	}
 	matched := make([]string, 0)
-	for _, item := range items {
+	for _, item := range versions.all {
 		if strings.HasPrefix(item, prefix) {
 			matched = append(matched, item)
 		}
@@ -213,6 +383,25 @@ func getNeoforgeLoaderVersions(ctx context.Context, version string) ([]string, e
 	return matched, nil
 }
 
+// neoforgeVersions holds the Maven version listing in its published order,
+// plus a lexicographically sorted copy for prefix lookups.
+type neoforgeVersions struct {
+	all    []string
+	sorted []string
+}
+
+func getNeoforgeVersions(ctx context.Context) (*neoforgeVersions, error) {
+	return neoforgeVersionsCache.get("", func() (*neoforgeVersions, error) {
+		all, err := fetchNeoforgeVersions(ctx)
+		if err != nil {
+			return nil, err
+		}
+		sorted := slices.Clone(all)
+		slices.Sort(sorted)
+		return &neoforgeVersions{all: all, sorted: sorted}, nil
+	})
+}
+
 func fetchNeoforgeVersions(ctx context.Context) ([]string, error) {
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, neoforgeMetadataURL, nil)
 	if err != nil {
@@ -226,10 +415,6 @@ func fetchNeoforgeVersions(ctx context.Context) ([]string, error) {
 	if resp.StatusCode != http.StatusOK {
 		return nil, fmt.Errorf("neoforge metadata error: %s", resp.Status)
 	}
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	var payload struct {
 		Versioning struct {
 			Versions struct {
@@ -237,7 +422,7 @@ func fetchNeoforgeVersions(ctx context.Context) ([]string, error) {
 			} `xml:"versions"`
 		} `xml:"versioning"`
 	}
-	if err := xml.Unmarshal(body, &payload); err != nil {
+	if err := xml.NewDecoder(resp.Body).Decode(&payload); err != nil {
 		return nil, err
 	}
 	return payload.Versioning.Versions.Version, nil
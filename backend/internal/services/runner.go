@@ -7,12 +7,13 @@ import (
 	"fmt"
 	"io"
 	"log/slog"
-	"os"
 	"os/exec"
 	"sync"
+	"sync/atomic"
 
 	"github.com/Petr1Furious/potato-launcher/backend/internal/config"
 	"github.com/Petr1Furious/potato-launcher/backend/internal/models"
+	store "github.com/Petr1Furious/potato-launcher/backend/internal/storage"
 )
 
 type SpecProvider interface {
@@ -22,9 +23,7 @@ type SpecProvider interface {
 type RunnerService struct {
 	cfg     *config.Config
 	store   SpecProvider
-	status  models.BuildStatus
-	mu      sync.RWMutex
-	running bool
+	running atomic.Bool
 	logger  *slog.Logger
 	hub     *Hub
 }
@@ -33,27 +32,22 @@ func NewRunnerService(cfg *config.Config, store SpecProvider, logger *slog.Logge
 	return &RunnerService{
 		cfg:    cfg,
 		store:  store,
-		status: models.BuildIdle,
 		logger: logger,
 		hub:    hub,
 	}
 }
 
 func (r *RunnerService) Status() models.BuildStatus {
-	r.mu.RLock()
-	defer r.mu.RUnlock()
-	return r.status
+	if r.running.Load() {
+		return models.BuildRunning
+	}
+	return models.BuildIdle
 }
 
 func (r *RunnerService) RunBuild(ctx context.Context) error {
-	r.mu.Lock()
-	if r.running {
-		r.mu.Unlock()
+	if !r.running.CompareAndSwap(false, true) {
 		return fmt.Errorf("build already running")
 	}
-	r.running = true
-	r.status = models.BuildRunning
-	r.mu.Unlock()
 
 	go r.execute(context.Background())
 	return nil
@@ -110,18 +104,17 @@ func (r *RunnerService) streamLog(pipe io.ReadCloser) {
 	}
 }
 
+type buildLogMessage struct {
+	Type    string `json:"type"`
+	Message string `json:"message"`
+}
+
 func (r *RunnerService) broadcastLog(text string) {
-	r.hub.Broadcast(map[string]interface{}{
-		"type":    "build_log",
-		"message": text,
-	})
+	r.hub.Broadcast(buildLogMessage{Type: "build_log", Message: text})
 }
 
 func (r *RunnerService) finish(runErr error) {
-	r.mu.Lock()
-	r.running = false
-	r.status = models.BuildIdle
-	r.mu.Unlock()
+	r.running.Store(false)
 
 	if runErr != nil {
 		r.logger.Error("runner failed", "error", runErr)
@@ -150,5 +143,5 @@ func (r *RunnerService) prepareSpecFile() error {
 	if err != nil {
 		return err
 	}
-	return os.WriteFile(r.cfg.SpecFile, raw, 0o644)
+	return store.WriteFileAtomic(r.cfg.SpecFile, raw, 0o644)
 }
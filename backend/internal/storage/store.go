@@ -1,10 +1,13 @@
 package store
 
 import (
+	"bytes"
 	"encoding/json"
 	"errors"
 	"fmt"
 	"os"
+	"path/filepath"
+	"slices"
 	"sync"
 
 	"github.com/Petr1Furious/potato-launcher/backend/internal/models"
@@ -13,6 +16,34 @@ import (
 type Store struct {
 	path string
 	mu   sync.RWMutex
+
+	cacheMu sync.Mutex
+	cache   *snapshot
+}
+
+// fileKey identifies a version of the spec file on disk.
+type fileKey struct {
+	modTime int64
+	size    int64
+}
+
+// snapshot is a decoded version of the spec file together with its raw bytes
+// and an index of instance positions by name.
+type snapshot struct {
+	key   fileKey
+	spec  *models.BuilderSpec
+	raw   []byte
+	index map[string]int
+}
+
+func newSnapshot(key fileKey, spec *models.BuilderSpec, raw []byte) *snapshot {
+	index := make(map[string]int, len(spec.Instances))
+	for i := range spec.Instances {
+		if _, ok := index[spec.Instances[i].Name]; !ok {
+			index[spec.Instances[i].Name] = i
+		}
+	}
+	return &snapshot{key: key, spec: spec, raw: raw, index: index}
 }
 
 func New(path string, initial *models.BuilderSpec) (*Store, error) {
@@ -26,67 +57,182 @@ func New(path string, initial *models.BuilderSpec) (*Store, error) {
 		if initial.Instances == nil {
 			initial.Instances = []models.BuilderInstance{}
 		}
-		if err := writeFile(path, initial); err != nil {
+		raw, err := encodeSpec(initial)
+		if err != nil {
+			return nil, err
+		}
+		if err := writeFile(path, raw); err != nil {
 			return nil, err
 		}
 	}
 	return &Store{path: path}, nil
 }
 
+// GetSpec returns the current spec. The returned value is shared between
+// callers and must not be modified; use Update to change the spec.
 func (s *Store) GetSpec() (*models.BuilderSpec, error) {
 	s.mu.RLock()
 	defer s.mu.RUnlock()
-	return readFile(s.path)
+	snap, err := s.load()
+	if err != nil {
+		return nil, err
+	}
+	return snap.spec, nil
 }
 
+// GetInstance returns the instance with the given name, or nil if there is
+// none. The returned instance is shared and must not be modified.
+func (s *Store) GetInstance(name string) (*models.BuilderInstance, error) {
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+	snap, err := s.load()
+	if err != nil {
+		return nil, err
+	}
+	idx, ok := snap.index[name]
+	if !ok {
+		return nil, nil
+	}
+	return &snap.spec.Instances[idx], nil
+}
+
+// Update applies mutator to a copy of the current spec and persists the
+// result. The file is left untouched when the mutation does not change its
+// encoded contents. Like GetSpec, the returned spec is shared and must not be
+// modified.
 func (s *Store) Update(mutator func(*models.BuilderSpec) error) (*models.BuilderSpec, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	spec, err := readFile(s.path)
+	current, err := s.load()
 	if err != nil {
 		return nil, err
 	}
-	if spec.Instances == nil {
-		spec.Instances = []models.BuilderInstance{}
-	}
+	spec := cloneSpec(current.spec)
 	if err := mutator(spec); err != nil {
 		return nil, err
 	}
-	if err := writeFile(s.path, spec); err != nil {
+	raw, err := encodeSpec(spec)
+	if err != nil {
+		return nil, err
+	}
+	if bytes.Equal(raw, current.raw) {
+		return current.spec, nil
+	}
+	if err := writeFile(s.path, raw); err != nil {
 		return nil, err
 	}
+	s.remember(spec, raw)
 	return spec, nil
 }
 
-func readFile(path string) (*models.BuilderSpec, error) {
+// load returns the parsed spec, re-reading the file only when its
+// modification time or size changed since the previous read.
+func (s *Store) load() (*snapshot, error) {
+	info, err := os.Stat(s.path)
+	if err != nil {
+		return nil, fmt.Errorf("stat spec: %w", err)
+	}
+	key := fileKey{modTime: info.ModTime().UnixNano(), size: info.Size()}
+
+	s.cacheMu.Lock()
+	defer s.cacheMu.Unlock()
+	if s.cache != nil && s.cache.key == key {
+		return s.cache, nil
+	}
+	spec, raw, err := readFile(s.path)
+	if err != nil {
+		return nil, err
+	}
+	s.cache = newSnapshot(key, spec, raw)
+	return s.cache, nil
+}
+
+// remember stores a freshly written spec as the cached value so that the
+// next read does not decode the file that was just encoded.
+func (s *Store) remember(spec *models.BuilderSpec, raw []byte) {
+	info, err := os.Stat(s.path)
+
+	s.cacheMu.Lock()
+	defer s.cacheMu.Unlock()
+	if err != nil {
+		s.cache = nil
+		return
+	}
+	s.cache = newSnapshot(fileKey{modTime: info.ModTime().UnixNano(), size: info.Size()}, spec, raw)
+}
+
+// cloneSpec copies the spec so that a mutator can append, replace or remove
+// instances without affecting readers of the cached value. Nested values are
+// shared, mutators only ever replace them as a whole.
+func cloneSpec(spec *models.BuilderSpec) *models.BuilderSpec {
+	out := *spec
+	out.Instances = slices.Clone(spec.Instances)
+	if out.Instances == nil {
+		out.Instances = []models.BuilderInstance{}
+	}
+	return &out
+}
+
+func readFile(path string) (*models.BuilderSpec, []byte, error) {
 	raw, err := os.ReadFile(path)
 	if err != nil {
-		return nil, fmt.Errorf("read spec: %w", err)
+		return nil, nil, fmt.Errorf("read spec: %w", err)
 	}
 	if len(raw) == 0 {
-		return &models.BuilderSpec{Instances: []models.BuilderInstance{}}, nil
+		return &models.BuilderSpec{Instances: []models.BuilderInstance{}}, raw, nil
 	}
 	var spec models.BuilderSpec
 	if err := json.Unmarshal(raw, &spec); err != nil {
-		return nil, fmt.Errorf("decode spec: %w", err)
+		return nil, nil, fmt.Errorf("decode spec: %w", err)
 	}
 	if spec.Instances == nil {
 		spec.Instances = []models.BuilderInstance{}
 	}
-	return &spec, nil
+	return &spec, raw, nil
 }
 
-func writeFile(path string, spec *models.BuilderSpec) error {
+func encodeSpec(spec *models.BuilderSpec) ([]byte, error) {
 	if spec.Instances == nil {
 		spec.Instances = []models.BuilderInstance{}
 	}
 	raw, err := json.MarshalIndent(spec, "", "  ")
 	if err != nil {
-		return fmt.Errorf("encode spec: %w", err)
+		return nil, fmt.Errorf("encode spec: %w", err)
 	}
-	if err := os.WriteFile(path, raw, 0o644); err != nil {
+	return raw, nil
+}
+
+func writeFile(path string, raw []byte) error {
+	if err := WriteFileAtomic(path, raw, 0o644); err != nil {
 		return fmt.Errorf("write spec: %w", err)
 	}
 	return nil
 }
+
+// WriteFileAtomic writes data to a temporary file in the same directory and
+// renames it over path, so readers never see a truncated or partial file.
+func WriteFileAtomic(path string, data []byte, perm os.FileMode) error {
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".tmp-*")
+	if err != nil {
+		return err
+	}
+	tmpName := tmp.Name()
+	defer os.Remove(tmpName)
+
+	if _, err := tmp.Write(data); err != nil {
+		tmp.Close()
+		return err
+	}
+	if err := tmp.Sync(); err != nil {
+		tmp.Close()
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		return err
+	}
+	if err := os.Chmod(tmpName, perm); err != nil {
+		return err
+	}
+	return os.Rename(tmpName, path)
+}
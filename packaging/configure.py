@@ -11,7 +11,6 @@ Requirements:
 
 from pathlib import Path
 import subprocess
-from tempfile import NamedTemporaryFile
 import httpx
 import tomlkit
 import sys
@@ -29,12 +28,13 @@ def process_icons() -> bool:
     if not source_icon:
         return False
 
+    icon_data = None
     if source_icon.startswith('http://') or source_icon.startswith('https://'):
-        with NamedTemporaryFile(delete=False) as temp_file:
-            resp = httpx.get(source_icon, follow_redirects=True)
-            resp.raise_for_status()
-            temp_file.write(resp.content)
-            source_icon = temp_file.name
+        resp = httpx.get(source_icon, follow_redirects=True)
+        resp.raise_for_status()
+        # imagemagick reads the image from stdin when given '-' as the input
+        icon_data = resp.content
+        source_icon = '-'
     elif sys.platform == 'win32':
         source_icon = source_icon.replace('/', '\\')
 
@@ -43,9 +43,21 @@ def process_icons() -> bool:
         # github runner uses old ubuntu
         magick_cmd = 'convert'
 
-    subprocess.check_call([magick_cmd, source_icon, '-resize', '512x512', ICON_PATH])
-    subprocess.check_call(
-        [magick_cmd, ICON_PATH, '-resize', '256x256', WINDOWS_ICON_PATH]
+    # decode the source once and write both sizes from the same pipeline
+    subprocess.run(
+        [
+            magick_cmd,
+            source_icon,
+            '-resize',
+            '512x512',
+            '-write',
+            ICON_PATH,
+            '-resize',
+            '256x256',
+            WINDOWS_ICON_PATH,
+        ],
+        input=icon_data,
+        check=True,
     )
 
     return True
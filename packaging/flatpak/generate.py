@@ -7,6 +7,8 @@ sys.path.append(str(Path(__file__).absolute().parent.parent))
 
 from utils import get_env
 
+PLACEHOLDER = re.compile(r'{{\s*(\w+)\s*}}')
+
 
 def main():
     with open('manifest-template.yml') as f:
@@ -34,11 +36,12 @@ def main():
     else:
         variables['gpg_key_line'] = ''
 
-    for k, v in variables.items():
-        rgx = re.compile(r'{{\s*' + k + r'\s*}}')
-        manifest_template = rgx.sub(v, manifest_template)
-        desktop_template = rgx.sub(v, desktop_template)
-        flatpakref_template = rgx.sub(v, flatpakref_template)
+    def substitute(match):
+        return variables.get(match.group(1), match.group(0))
+
+    manifest_template = PLACEHOLDER.sub(substitute, manifest_template)
+    desktop_template = PLACEHOLDER.sub(substitute, desktop_template)
+    flatpakref_template = PLACEHOLDER.sub(substitute, flatpakref_template)
 
     with open('manifest.yml', 'w') as f:
         f.write(manifest_template)
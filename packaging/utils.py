@@ -1,15 +1,19 @@
+import functools
 import os
 from pathlib import Path
 
 
 REPO_ROOT = Path(__file__).absolute().parent.parent
 ENV_FILE = REPO_ROOT / 'build.env'
-if ENV_FILE.exists():
-    _dotenv_contents = dict(
-        x.split('=', 1) for x in ENV_FILE.read_text().splitlines() if x
-    )
-else:
-    _dotenv_contents = {}
+
+
+@functools.cache
+def _dotenv() -> dict[str, str]:
+    # keep the format in sync with launcher/build.rs and packaging/nix/loadDotenv.nix
+    if not ENV_FILE.exists():
+        return {}
+    return dict(x.split('=', 1) for x in ENV_FILE.read_text().splitlines() if x)
+
 
 _sentinel = object()
 
@@ -18,7 +22,7 @@ def get_env(name, default=_sentinel):
     env_val = os.getenv(name)
     # not used intentionally so that empty values are considered missing
     if not env_val:
-        env_val = _dotenv_contents.get(name)
+        env_val = _dotenv().get(name)
     if not env_val:
         if default is _sentinel:
             raise KeyError(f'Config variable {name} is not set')
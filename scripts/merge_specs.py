@@ -20,7 +20,12 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def die(msg: str) -> None:
@@ -28,9 +33,26 @@ def die(msg: str) -> None:
     raise SystemExit(2)
 
 
+def loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, value: Any) -> None:
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(value, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
 def read_json(path: Path) -> Any:
     try:
-        raw = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except FileNotFoundError:
         die(f"file not found: {path}")
     except Exception as e:
@@ -40,73 +62,64 @@ def read_json(path: Path) -> Any:
     if not raw:
         return {}
     try:
-        return json.loads(raw)
+        return loads(raw)
     except Exception as e:
         die(f"failed to parse JSON {path}: {e}")
 
 
-def instance_name(inst: Any) -> Tuple[bool, str]:
-    if isinstance(inst, dict) and isinstance(inst.get("name"), str):
-        return True, inst["name"]
-    return False, ""
+def instance_name(inst: Any) -> Optional[str]:
+    if isinstance(inst, dict):
+        name = inst.get("name")
+        if isinstance(name, str):
+            return name
+    return None
+
+
+def instance_list(spec: Dict[str, Any]) -> List[Any]:
+    instances = spec.get("instances", [])
+    return instances if isinstance(instances, list) else []
 
 
 def merge_instances(spec1: Dict[str, Any], spec2: Dict[str, Any]) -> List[Any]:
-    i1 = spec1.get("instances", [])
-    i2 = spec2.get("instances", [])
-
-    if not isinstance(i1, list):
-        i1 = []
-    if not isinstance(i2, list):
-        i2 = []
-
-    names2 = set()
-    for inst in i2:
-        ok, name = instance_name(inst)
-        if ok:
-            names2.add(name)
-
-    out: List[Any] = []
-    for inst in i1:
-        ok, name = instance_name(inst)
-        if ok and name in names2:
-            continue
-        out.append(inst)
+    i1 = instance_list(spec1)
+    i2 = instance_list(spec2)
 
+    names2 = {name for name in map(instance_name, i2) if name is not None}
+    # None is never in names2, so unnamed spec1 instances are always kept
+    out: List[Any] = [inst for inst in i1 if instance_name(inst) not in names2]
     out.extend(i2)
     return out
 
 
-def merge_value(v1: Any, v2: Any) -> Any:
-    # spec2 wins if it provides a value; for dicts, merge recursively.
-    if isinstance(v1, dict) and isinstance(v2, dict):
-        return merge_dict(v1, v2)
-    return v2
-
-
-def merge_dict(d1: Dict[str, Any], d2: Dict[str, Any]) -> Dict[str, Any]:
-    out: Dict[str, Any] = dict(d1)
-    for k, v2 in d2.items():
-        if k == "instances":
-            # handled at top-level merge
-            out[k] = v2
-            continue
-        if k in out:
-            out[k] = merge_value(out[k], v2)
+def merge_into(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    # src wins if it provides a value; dicts are merged recursively, in place.
+    # "instances" is never merged here, the top level is handled in merge_specs.
+    for k, v in src.items():
+        current = dst.get(k)
+        if k != "instances" and isinstance(current, dict) and isinstance(v, dict):
+            merge_into(current, v)
         else:
-            out[k] = v2
-    return out
+            dst[k] = v
 
 
 def merge_specs(spec1: Any, spec2: Any) -> Dict[str, Any]:
+    """Merge spec2 into spec1, which is modified in place and returned."""
     if not isinstance(spec1, dict):
         die("spec1 must be a JSON object")
     if not isinstance(spec2, dict):
         die("spec2 must be a JSON object")
 
-    out = merge_dict(spec1, spec2)
-    out["instances"] = merge_instances(spec1, spec2)
-    return out
+    # nothing to merge into or from an empty spec, only "instances" to normalize
+    if not spec1 or not spec2:
+        out = spec1 or spec2
+        out["instances"] = instance_list(out)
+        return out
+
+    # computed first: merge_into replaces spec1["instances"] with spec2's
+    instances = merge_instances(spec1, spec2)
+    merge_into(spec1, spec2)
+    spec1["instances"] = instances
+    return spec1
 
 
 def main(argv: List[str]) -> int:
@@ -123,9 +136,7 @@ def main(argv: List[str]) -> int:
     merged = merge_specs(spec1, spec2)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(merged, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-    )
+    write_json(out_path, merged)
     return 0
 
 